@@ -1,16 +1,19 @@
 import collections
+import functools
 import heapq
 import logging
 import operator
 import os
 import threading
 import warnings
-from typing import NamedTuple, Union, Set, List, Type
+import weakref
+from typing import Callable, NamedTuple, Union, Set, List, Tuple, Type
 
 import pymorphy3.lang
 from pymorphy3 import opencorpora_dict
 from pymorphy3 import tagset
 from pymorphy3.dawg import ConditionalProbDistDAWG
+from pymorphy3.tagset import popcount
 from pymorphy3.units.base import BaseAnalyzerUnit
 
 logger = logging.getLogger(__name__)
@@ -30,9 +33,16 @@ class Parse(_Parse):
     """
     Parse result wrapper.
     """
+    __slots__ = ()
 
-    _morph: "MorphAnalyzer" = None
-    _dict: opencorpora_dict.Dictionary = None
+    @property
+    def _morph(self) -> "MorphAnalyzer":
+        # analyzer units which produced the parse are bound to an analyzer
+        return self.methods_stack[0][0].morph
+
+    @property
+    def _dict(self) -> opencorpora_dict.Dictionary:
+        return self._morph.dictionary
 
     def inflect(self, required_grammemes: Set[str]) -> Union["Parse", None]:
         res = self._morph._inflect(self, required_grammemes)
@@ -52,16 +62,13 @@ class Parse(_Parse):
     @property
     def is_known(self):
         """ True if this form is a known dictionary form. """
-        return self._dict.word_is_known(
-            word=self.word,
-            substitutes_compiled=self._morph.char_substitutes
-        )
+        return self._morph.word_is_known(self.word)
 
     @property
     def normalized(self):
         """ A :class:`Parse` instance for :attr:`self.normal_form`. """
         last_method = self.methods_stack[-1]
-        return self.__class__(*last_method[0].normalized(self))
+        return self._morph._wrap(last_method[0].normalized(self))
 
     # @property
     # def paradigm(self):
@@ -73,33 +80,46 @@ class ProbabilityEstimator:
         cpd_path = os.path.join(dict_path, 'p_t_given_w.intdawg')
         self.p_t_given_w = ConditionalProbDistDAWG().load(cpd_path)
 
-    def apply_to_parses(self, word: str, word_lower: str, parses: List[Parse]) -> List[_Parse]:
+    def apply_to_parses(self, word: str, word_lower: str, parses: List[Parse],
+                        topk: Union[int, None] = None) -> List[_Parse]:
+        """
+        Return ``parses`` with scores replaced by P(t|w) estimates.
+        If ``topk`` is not None, only ``topk`` best parses are returned.
+        """
         if not parses:
             return []
 
-        probs = [self.p_t_given_w.prob(word_lower, tag)
-                for (word, tag, normal_form, score, methods_stack) in parses]
-
-        if sum(probs) == 0:
-            # no P(t|w) information is available; return normalized estimate
-            k = 1.0 / sum(map(_score_getter, parses))
-            return [
-                _Parse(word, tag, normal_form, score*k, methods_stack)
-                for (word, tag, normal_form, score, methods_stack) in parses
-            ]
-
-        # replace score with P(t|w) probability
-        return sorted([
-            _Parse(word, tag, normal_form, prob, methods_stack)
-            for (word, tag, normal_form, score, methods_stack), prob
-            in zip(parses, probs)
-        ], key=_score_getter, reverse=True)
+        probs_by_tag = self.p_t_given_w.probs_for_word(word_lower)
+
+        if probs_by_tag:
+            # replace score with P(t|w) probability
+            result = []
+            total_prob = 0
+            for word, tag, normal_form, score, methods_stack in parses:
+                prob = probs_by_tag.get(str(tag), 0)
+                total_prob += prob
+                result.append(_Parse(word, tag, normal_form, prob, methods_stack))
+
+            if total_prob:
+                if topk is not None and 0 <= topk < len(result):
+                    # same as sorting and truncating, but O(N log k)
+                    return heapq.nlargest(topk, result, key=_score_getter)
+                result.sort(key=_score_getter, reverse=True)
+                return result
+
+        # no P(t|w) information is available; return normalized estimate
+        k = 1.0 / sum(map(_score_getter, parses))
+        return [
+            _Parse(word, tag, normal_form, score*k, methods_stack)
+            for (word, tag, normal_form, score, methods_stack) in parses[:topk]
+        ]
 
     def apply_to_tags(self, word: str, word_lower: str, tags: List[tagset.OpencorporaTag]) -> List[tagset.OpencorporaTag]:
         if not tags:
             return tags
+        probs_by_tag = self.p_t_given_w.probs_for_word(word_lower)
         return sorted(tags,
-            key=lambda tag: self.p_t_given_w.prob(word_lower, tag),
+            key=lambda tag: probs_by_tag.get(str(tag), 0),
             reverse=True
         )
 
@@ -163,6 +183,47 @@ def lang_dict_path(lang):
     )
 
 
+class _DictionaryBundle:
+    """
+    Loaded dictionary data which is shared between all
+    :class:`MorphAnalyzer` instances using the same dictionary.
+    All the data is read-only after loading.
+    """
+    def __init__(self, path):
+        self.dictionary = opencorpora_dict.Dictionary(path)
+        self.prob_estimators = {}
+        self.char_substitutes = {}
+
+    def init_tag_class(self):
+        # Tag class is global; re-initialize it when the bundle
+        # is reused after another dictionary was loaded.
+        self.dictionary.Tag._init_grammemes(self.dictionary.grammemes)
+
+
+# (realpath, meta.json mtime) -> _DictionaryBundle
+_DICT_CACHE: "weakref.WeakValueDictionary[Tuple[str, int], _DictionaryBundle]" = weakref.WeakValueDictionary()
+# Guards _DICT_CACHE and the global Tag class state (known grammemes,
+# Latin/Cyrillic maps) which dictionary loading and analyzer units change.
+_GLOBAL_STATE_LOCK = threading.RLock()
+
+
+def _cached_list_method(method, maxsize):
+    """
+    Wrap a ``method`` which returns a list of immutable items
+    into a LRU cache. Lists returned by the wrapper are fresh copies,
+    so callers are free to modify them.
+    """
+    cached = functools.lru_cache(maxsize)(lambda word: tuple(method(word)))
+
+    @functools.wraps(method)
+    def wrapper(word):
+        return list(cached(word))
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
 class _Unit(NamedTuple):
     analyzer: BaseAnalyzerUnit
     is_terminal: bool
@@ -201,52 +262,79 @@ class MorphAnalyzer:
 
         >>> morph = pymorphy3.MorphAnalyzer(result_type=None)
 
+    A custom ``result_type`` is called as ``result_type(word, tag,
+    normal_form, score, methods_stack)``. Custom result types which need
+    ``_morph`` or ``_dict`` attributes (e.g. to call :meth:`Parse.inflect`
+    or :attr:`Parse.lexeme`) must subclass :class:`Parse`; these
+    attributes are not added to other classes.
+
+    Results of :meth:`parse`, :meth:`tag` and :meth:`normal_forms` are
+    cached per analyzer instance; ``cache_size`` is a maximum number
+    of cached words for each method. Pass ``cache_size=None`` for an
+    unlimited cache or ``cache_size=0`` to disable caching. Cache
+    statistics are available as ``morph.parse.cache_info()``.
+
+    Once created, a :class:`MorphAnalyzer` instance can be used
+    from multiple threads. Creation of analyzers is serialized
+    process-wide because the Tag class is global; dictionaries
+    are loaded once and shared between analyzers.
+
     """
     DICT_PATH_ENV_VARIABLE = 'PYMORPHY2_DICT_PATH'
     DEFAULT_UNITS = pymorphy3.lang.ru.DEFAULT_UNITS
     DEFAULT_SUBSTITUTES = pymorphy3.lang.ru.CHAR_SUBSTITUTES
     char_substitutes = None
 
-    _lock = threading.RLock()
     _units: List[_Unit]
+    _unit_groups: List[Tuple[BaseAnalyzerUnit, ...]]
     _result_type: Union[Type[Parse], None]
+    _wrap: Union[Callable[[tuple], Parse], None]
 
     def __init__(self, path=None, lang=None, result_type=Parse, units=None,
-                 probability_estimator_cls=auto, char_substitutes=auto):
+                 probability_estimator_cls=auto, char_substitutes=auto,
+                 cache_size=20000):
 
         # save arguments for pickling/unpickling
         self._path = path
         self._lang = lang
+        self._cache_size = cache_size
 
         if path is None and lang is None:
             lang = 'ru'
 
         path = self.choose_dictionary_path(path, lang)
 
-        with self._lock:
-            self.dictionary = opencorpora_dict.Dictionary(path)
+        # Dictionary loading and unit initialization both change the
+        # global Tag class, so they run under the same lock;
+        # _load_bundle and _init_char_substitutes rely on it.
+        with _GLOBAL_STATE_LOCK:
+            self._bundle = self._load_bundle(path)
+            self.dictionary = self._bundle.dictionary
             self.lang = self.choose_language(self.dictionary, lang)
 
-            self.prob_estimator = self._get_prob_estimator(
-                probability_estimator_cls, self.dictionary, path
-            )
-
-            if result_type is not None:
-                # create a subclass with the same name,
-                # but with _morph attribute bound to self
-                res_type = type(
-                    result_type.__name__,
-                    (result_type,),
-                    {'_morph': self, '_dict': self.dictionary}
+            estimators = self._bundle.prob_estimators
+            if probability_estimator_cls not in estimators:
+                estimators[probability_estimator_cls] = self._get_prob_estimator(
+                    probability_estimator_cls, self.dictionary, path
                 )
-                self._result_type = res_type
+            self.prob_estimator = estimators[probability_estimator_cls]
+
+            self._result_type = result_type
+            if result_type is None:
+                self._wrap = None
+            elif getattr(result_type, '__new__', None) is Parse.__new__:
+                # tuple.__new__ skips argument unpacking and
+                # validation of the namedtuple constructor;
+                # it is only safe when __new__ is not overridden
+                self._wrap = functools.partial(tuple.__new__, result_type)
             else:
-                self._result_type = None
+                self._wrap = lambda parse: result_type(*parse)
 
-            self._result_type_orig = result_type
             self._init_char_substitutes(char_substitutes)
             self._init_units(units)
 
+        self._init_cache(cache_size)
+
     def _init_units(self, units_unbound=None):
         if units_unbound is None:
             units_unbound = self._config_value('DEFAULT_UNITS', self.DEFAULT_UNITS)
@@ -261,10 +349,49 @@ class MorphAnalyzer:
             else:
                 self._units.append(_Unit(self._bound_unit(item), True))
 
+        # Units grouped by terminal unit: parsing stops after
+        # the first group which produced any results.
+        self._unit_groups = []
+        group = []
+        for analyzer, is_terminal in self._units:
+            group.append(analyzer)
+            if is_terminal:
+                self._unit_groups.append(tuple(group))
+                group = []
+
+    def _init_cache(self, cache_size):
+        if cache_size == 0:
+            return
+        # caches are bound to the instance, so analyzers
+        # with different dictionaries or units don't share results
+        self.parse = _cached_list_method(self.parse, cache_size)
+        self.tag = _cached_list_method(self.tag, cache_size)
+        self.normal_forms = _cached_list_method(self.normal_forms, cache_size)
+
     def _init_char_substitutes(self, char_substitutes):
         if char_substitutes is auto:
             char_substitutes = self._config_value('CHAR_SUBSTITUTES', self.DEFAULT_SUBSTITUTES)
-        self.char_substitutes = self.dictionary.words.compile_replaces(char_substitutes or {})
+        char_substitutes = char_substitutes or {}
+        self._substituted_chars = frozenset(char_substitutes)
+
+        compiled = self._bundle.char_substitutes
+        key = tuple(sorted(char_substitutes.items()))
+        if key not in compiled:
+            compiled[key] = self.dictionary.words.compile_replaces(char_substitutes)
+        self.char_substitutes = compiled[key]
+
+    @staticmethod
+    def _load_bundle(path):
+        # a dictionary recompiled into the same directory gets a new key
+        meta_mtime = os.stat(os.path.join(path, 'meta.json')).st_mtime_ns
+        key = (os.path.realpath(path), meta_mtime)
+        bundle = _DICT_CACHE.get(key)
+        if bundle is None:
+            bundle = _DictionaryBundle(path)
+            _DICT_CACHE[key] = bundle
+        else:
+            bundle.init_tag_class()
+        return bundle
 
     def _bound_unit(self, unit):
         unit = unit.clone()
@@ -331,33 +458,59 @@ class MorphAnalyzer:
 
         (or plain tuples if ``result_type=None`` was used in constructor).
         """
-        res: List[Parse] = []
-        seen = set()
         word_lower = word.lower()
+        res = self._parse_by_units(word, word_lower)
 
-        for analyzer, is_terminal in self._units:
-            res.extend(analyzer.parse(word, word_lower, seen))
+        if self.prob_estimator is not None:
+            res = self.prob_estimator.apply_to_parses(word, word_lower, res)
 
-            if is_terminal and res:
-                break
+        if self._wrap is None:
+            return res
+
+        return list(map(self._wrap, res))
+
+    def parse_top(self, word: str, k: int = 1) -> List[Parse]:
+        """
+        Return ``k`` best parses of the word. The result is the same
+        as ``morph.parse(word)[:k]``, but the full list of parses
+        doesn't have to be sorted. Results of this method are not cached.
+        """
+        if k < 0:
+            raise ValueError(f"k must be non-negative, got {k}")
+        word_lower = word.lower()
+        res = self._parse_by_units(word, word_lower)
 
         if self.prob_estimator is not None:
-            res = self.prob_estimator.apply_to_parses(word, word_lower, res)
+            res = self.prob_estimator.apply_to_parses(word, word_lower, res, topk=k)
+        else:
+            res = res[:k]
 
-        if self._result_type is None:
+        if self._wrap is None:
             return res
 
-        return [self._result_type(*p) for p in res]
+        return list(map(self._wrap, res))
+
+    def _parse_by_units(self, word: str, word_lower: str) -> List[Parse]:
+        res: List[Parse] = []
+        seen = set()
+
+        for group in self._unit_groups:
+            for analyzer in group:
+                res.extend(analyzer.parse(word, word_lower, seen))
+            if res:
+                break
+
+        return res
 
     def tag(self, word: str) -> List[tagset.OpencorporaTag]:
         res = []
         seen = set()
         word_lower = word.lower()
 
-        for analyzer, is_terminal in self._units:
-            res.extend(analyzer.tag(word, word_lower, seen))
-
-            if is_terminal and res:
+        for group in self._unit_groups:
+            for analyzer in group:
+                res.extend(analyzer.tag(word, word_lower, seen))
+            if res:
                 break
 
         if self.prob_estimator is not None:
@@ -368,15 +521,8 @@ class MorphAnalyzer:
         """
         Return a list of word normal forms.
         """
-        seen = set()
-        result = []
-
-        for p in self.parse(word):
-            normal_form = p[2]
-            if normal_form not in seen:
-                result.append(normal_form)
-                seen.add(normal_form)
-        return result
+        # dict keeps insertion order, so this is an ordered deduplication
+        return list(dict.fromkeys([p[2] for p in self.parse(word)]))
 
     # ==== inflection ========
 
@@ -388,25 +534,34 @@ class MorphAnalyzer:
         last_method = methods_stack[-1]
         result = last_method[0].get_lexeme(form)
 
-        if self._result_type is None:
+        if self._wrap is None:
             return result
-        return [self._result_type(*p) for p in result]
+        return list(map(self._wrap, result))
 
     def _inflect(self, form: Parse, required_grammemes: Set[str]):
-        possible_results = [f for f in self.get_lexeme(form)
-                            if required_grammemes <= f[1].grammemes]
+        to_mask = self.TagClass._grammemes_to_mask
+        lexeme = self.get_lexeme(form)
+
+        required_mask = to_mask(required_grammemes)
+        possible_results = [f for f in lexeme
+                            if not required_mask & ~f[1]._grammemes_mask]
 
         if not possible_results:
             required_grammemes = self.TagClass.fix_rare_cases(required_grammemes)
-            possible_results = [f for f in self.get_lexeme(form)
-                                if required_grammemes <= f[1].grammemes]
+            required_mask = to_mask(required_grammemes)
+            possible_results = [f for f in lexeme
+                                if not required_mask & ~f[1]._grammemes_mask]
+
+        grammemes_mask = to_mask(form[1].updated_grammemes(required_grammemes))
 
-        grammemes = form[1].updated_grammemes(required_grammemes)
         def similarity(frm):
-            tag = frm[1]
-            return len(grammemes & tag.grammemes) - 0.1 * len(grammemes ^ tag.grammemes)
+            tag_mask = frm[1]._grammemes_mask
+            common = popcount(grammemes_mask & tag_mask)
+            different = popcount(grammemes_mask ^ tag_mask)
+            return common - 0.1 * different
 
-        return heapq.nlargest(1, possible_results, key=similarity)
+        best = max(possible_results, key=similarity, default=None)
+        return [] if best is None else [best]
 
     # ====== misc =========
 
@@ -421,10 +576,10 @@ class MorphAnalyzer:
         for word, tag, normal_form, para_id, idx in self.dictionary.iter_known_words(prefix):
             methods = ((self._units[0][0], word, para_id, idx),)
             parse = (word, tag, normal_form, 1.0, methods)
-            if self._result_type is None:
+            if self._wrap is None:
                 yield parse
             else:
-                yield self._result_type(*parse)
+                yield self._wrap(parse)
 
     def word_is_known(self, word: str, strict: bool = False) -> bool:
         """
@@ -443,9 +598,13 @@ class MorphAnalyzer:
             method should be used with extra care.
 
         """
+        word = word.lower()
+        if strict or self._substituted_chars.isdisjoint(word):
+            # there is nothing to substitute; exact lookup is faster
+            return self.dictionary.word_is_known(word)
         return self.dictionary.word_is_known(
-            word = word.lower(),
-            substitutes_compiled = None if strict else self.char_substitutes
+            word = word,
+            substitutes_compiled = self.char_substitutes
         )
 
     @property
@@ -461,5 +620,6 @@ class MorphAnalyzer:
         return self.TagClass.lat2cyr(tag_or_grammeme)
 
     def __reduce__(self):
-        args = (self._path, self._lang, self._result_type_orig, self._units_unbound)
-        return self.__class__, args, None
+        args = (self._path, self._lang, self._result_type, self._units_unbound)
+        factory = functools.partial(self.__class__, cache_size=self._cache_size)
+        return factory, args, None
@@ -62,6 +62,19 @@ class ConditionalProbDistDAWG(IntCompletionDAWG):
         dawg_key = f"{word}:{tag}"
         return self.get(dawg_key, 0) / self.MULTIPLIER
 
+    def probs_for_word(self, word):
+        """
+        Return a ``{tag_str: probability}`` dict with all tags
+        stored for a ``word``. All tags are found in a single DAWG walk.
+        """
+        prefix = f"{word}:"
+        start = len(prefix)
+        multiplier = self.MULTIPLIER
+        return {
+            key[start:]: value / multiplier
+            for key, value in self.items(prefix)
+        }
+
 
 class DawgPrefixMatcher(DAWG):
     def is_prefixed(self, word):
@@ -4,11 +4,14 @@ module for saving and loading pymorphy3 dictionaries.
 """
 import array
 import collections
+import collections.abc
 import datetime
 import logging
 import os
 import struct
-from typing import NamedTuple, Union, List, Dict, Type
+import threading
+from sys import intern
+from typing import NamedTuple, Union, List, Dict, Sequence, Type
 
 import pymorphy3
 from pymorphy3 import tagset
@@ -17,20 +20,82 @@ from pymorphy3.utils import json_write, json_read
 
 logger = logging.getLogger(__name__)
 
-CURRENT_FORMAT_VERSION = '2.4'
+CURRENT_FORMAT_VERSION = '2.5'
+
+
+# typecode of 32-bit unsigned paradigm offsets
+# (item sizes of array typecodes are platform-dependent)
+_OFFSET_TYPECODE = next(code for code in "IL" if array.array(code).itemsize == 4)
 
 
 class LoadedDictionary(NamedTuple):
     meta: Union[collections.OrderedDict, Dict]
     gramtab: List[tagset.OpencorporaTag]
+    grammemes: List[list]
     suffixes: List[str]
-    paradigms: List[array.array]
+    paradigms: Sequence[array.array]
+    paradigms_flat: array.array
+    paradigms_offsets: array.array
     words: dawg.WordsDawg
-    prediction_suffixes_dawgs: List[dawg.PredictionSuffixesDAWG]
+    prediction_suffixes_dawgs: Sequence[dawg.PredictionSuffixesDAWG]
     Tag: Type[tagset.OpencorporaTag]
     paradigm_prefixes: List[str]
 
 
+class _ParadigmList(collections.abc.Sequence):
+    """
+    A read-only list of paradigms backed by a single flat array
+    of paradigm data and an array of paradigm start offsets in it.
+    Paradigms are sliced from the flat array on access.
+    """
+    def __init__(self, flat, offsets):
+        self._flat = flat
+        self._offsets = offsets
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("paradigm index out of range")
+        return self._flat[self._offsets[index]:self._offsets[index+1]]
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+
+class _LazyDawgList(collections.abc.Sequence):
+    """
+    A read-only list of DAWGs which are loaded from files
+    on first access.
+    """
+    def __init__(self, dawg_cls, filenames):
+        self._dawg_cls = dawg_cls
+        self._filenames = list(filenames)
+        self._dawgs = [None] * len(self._filenames)
+        self._lock = threading.Lock()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        d = self._dawgs[index]
+        if d is None:
+            with self._lock:
+                d = self._dawgs[index]
+                if d is None:
+                    d = self._dawg_cls().load(self._filenames[index])
+                    self._dawgs[index] = d
+        return d
+
+    def __len__(self):
+        return len(self._filenames)
+
+    def __repr__(self):
+        loaded = sum(d is not None for d in self._dawgs)
+        return f"<{self.__class__.__name__}: {loaded} of {len(self)} loaded>"
+
+
 def load_dict(path, gramtab_format='opencorpora-int'):
     """
     Load pymorphy3 dictionary.
@@ -42,32 +107,52 @@ def load_dict(path, gramtab_format='opencorpora-int'):
     meta = load_meta(_f('meta.json'))
     _assert_format_is_compatible(meta, path)
 
-    Tag = _load_tag_class(gramtab_format, _f('grammemes.json'))
-
-    str_gramtab = _load_gramtab(meta, gramtab_format, path)
-    gramtab = [Tag(tag_str) for tag_str in str_gramtab]
-
-    suffixes = json_read(_f('suffixes.json'))
-    paradigms = _load_paradigms(_f('paradigms.array'))
-    words = dawg.WordsDawg().load(_f('words.dawg'))
-
     try:
         paradigm_prefixes = meta["compile_options"]["paradigm_prefixes"]
     except KeyError:
         # support dicts v2.4
         paradigm_prefixes = json_read(_f('paradigm-prefixes.json'))
+    paradigm_prefixes = [intern(prefix) for prefix in paradigm_prefixes]
 
-    prediction_suffixes_dawgs = []
+    prediction_suffixes_filenames = []
     for prefix_id in range(len(paradigm_prefixes)):
         fn = _f(f'prediction-suffixes-{prefix_id}.dawg')
         assert os.path.exists(fn)
-        prediction_suffixes_dawgs.append(dawg.PredictionSuffixesDAWG().load(fn))
+        prediction_suffixes_filenames.append(fn)
+
+    # prediction DAWGs are only needed for unknown words
+    prediction_suffixes_dawgs = _LazyDawgList(
+        dawg.PredictionSuffixesDAWG, prediction_suffixes_filenames
+    )
+
+    grammemes = json_read(_f('grammemes.json'))
+    Tag = _load_tag_class(gramtab_format, grammemes)
+
+    str_gramtab = _load_gramtab(meta, gramtab_format, path)
+    gramtab = [Tag(tag_str) for tag_str in str_gramtab]
+
+    # interned strings make lookups and comparisons cheaper
+    suffixes = [intern(suffix) for suffix in json_read(_f('suffixes.json'))]
+
+    if os.path.exists(_f('paradigms-offsets.array')):
+        paradigms_flat, paradigms_offsets = _load_paradigms_flat(
+            _f('paradigms-flat.array'),
+            _f('paradigms-offsets.array')
+        )
+    else:
+        # support dicts v2.4
+        paradigms_flat, paradigms_offsets = _load_paradigms(_f('paradigms.array'))
+
+    words = dawg.WordsDawg().load(_f('words.dawg'))
 
     return LoadedDictionary(
         meta=meta,
         gramtab=gramtab,
+        grammemes=grammemes,
         suffixes=suffixes,
-        paradigms=paradigms,
+        paradigms=_ParadigmList(paradigms_flat, paradigms_offsets),
+        paradigms_flat=paradigms_flat,
+        paradigms_offsets=paradigms_offsets,
         words=words,
         prediction_suffixes_dawgs=prediction_suffixes_dawgs,
         Tag=Tag,
@@ -95,12 +180,19 @@ def save_compiled_dict(compiled_dict, out_path, source_name, language_code):
 
         json_write(_f(gramtab_name), new_gramtab)
 
+    # paradigms.array is kept for compatibility with older pymorphy3 versions
     with open(_f('paradigms.array'), 'wb') as f:
         f.write(struct.pack("<H", len(compiled_dict.paradigms)))
         for para in compiled_dict.paradigms:
             f.write(struct.pack("<H", len(para)))
             para.tofile(f)
 
+    _save_paradigms_flat(
+        compiled_dict.paradigms,
+        _f('paradigms-flat.array'),
+        _f('paradigms-offsets.array')
+    )
+
     json_write(_f('suffixes.json'), compiled_dict.suffixes)
     compiled_dict.words_dawg.save(_f('words.dawg'))
 
@@ -165,7 +257,7 @@ def update_meta(filename, extra):
     write_meta(filename, meta)
 
 
-def _load_tag_class(gramtab_format, grammemes_filename):
+def _load_tag_class(gramtab_format, grammemes):
     """ Load and initialize Tag class (according to ``gramtab_format``). """
     if gramtab_format not in tagset.registry:
         raise ValueError(f"This gramtab format ('{gramtab_format}') is unsupported.")
@@ -173,7 +265,6 @@ def _load_tag_class(gramtab_format, grammemes_filename):
     # FIXME: clone the class
     Tag = tagset.registry[gramtab_format] #._clone_class()
 
-    grammemes = json_read(grammemes_filename)
     Tag._init_grammemes(grammemes)
 
     return Tag
@@ -190,19 +281,71 @@ def _load_gramtab(meta, gramtab_format, path):
 
 
 def _load_paradigms(filename):
-    """ Load paradigms data """
-    paradigms = []
+    """
+    Load paradigms data from paradigms.array.
+    Return a flat array of paradigm data and an array
+    of paradigm start offsets in it.
+    """
+    # the file is small; reading it at once is faster than
+    # reading each paradigm separately
     with open(filename, 'rb') as f:
-        paradigms_count = struct.unpack("<H", f.read(2))[0]
+        return _parse_paradigms(f.read())
+
+
+def _parse_paradigms(buffer):
+    """ Parse paradigms data from a bytes-like ``buffer`` """
+    flat = array.array("H")
+    offsets = array.array(_OFFSET_TYPECODE, [0])
 
-        for x in range(paradigms_count):
-            paradigm_len = struct.unpack("<H", f.read(2))[0]
+    # The data is a sequence of unsigned shorts: paradigms count,
+    # then (length, *data) for each paradigm. Count and lengths
+    # are little-endian.
+    unpack_from = struct.unpack_from
+    paradigms_count, = unpack_from("<H", buffer, 0)
+    offset = 2
+    for x in range(paradigms_count):
+        paradigm_len, = unpack_from("<H", buffer, offset)
+        offset += 2
+
+        flat.frombytes(buffer[offset:offset + paradigm_len*2])
+        offset += paradigm_len*2
+
+        offsets.append(len(flat))
+    return flat, offsets
+
+
+def _save_paradigms_flat(paradigms, flat_filename, offsets_filename):
+    """
+    Save paradigms as a single flat array of unsigned shorts
+    and an array of paradigm start offsets in it
+    (the last offset is the total length).
+    """
+    flat = array.array("H")
+    offsets = array.array(_OFFSET_TYPECODE, [0])
+    for para in paradigms:
+        flat.extend(para)
+        offsets.append(len(flat))
+
+    with open(flat_filename, 'wb') as f:
+        flat.tofile(f)
+    with open(offsets_filename, 'wb') as f:
+        offsets.tofile(f)
+
+
+def _load_paradigms_flat(flat_filename, offsets_filename):
+    """
+    Load paradigms data saved by :func:`_save_paradigms_flat`.
+    The data is used as-is, without splitting it into paradigms.
+    """
+    flat = array.array("H")
+    with open(flat_filename, 'rb') as f:
+        flat.frombytes(f.read())
 
-            para = array.array("H")
-            para.fromfile(f, paradigm_len)
+    offsets = array.array(_OFFSET_TYPECODE)
+    with open(offsets_filename, 'rb') as f:
+        offsets.frombytes(f.read())
 
-            paradigms.append(para)
-    return paradigms
+    return flat, offsets
 
 
 def _assert_format_is_compatible(meta, path):
@@ -26,7 +26,10 @@ class Dictionary:
 
         # attributes from opencorpora_dict.storage.LoadedDictionary
         self.paradigms = self._data.paradigms
+        self.paradigms_flat = self._data.paradigms_flat
+        self.paradigms_offsets = self._data.paradigms_offsets
         self.gramtab = self._data.gramtab
+        self.grammemes = self._data.grammemes
         self.paradigm_prefixes = self._data.paradigm_prefixes
         self.suffixes = self._data.suffixes
         self.words: dawg.WordsDawg = self._data.words
@@ -42,9 +45,9 @@ class Dictionary:
         """
         Return tag as a string.
         """
-        paradigm = self.paradigms[para_id]
-        tag_info_offset = len(paradigm) // 3
-        tag_id = paradigm[tag_info_offset + idx]
+        start = self.paradigms_offsets[para_id]
+        paradigm_len = (self.paradigms_offsets[para_id+1] - start) // 3
+        tag_id = self.paradigms_flat[start + paradigm_len + idx]
         return self.gramtab[tag_id]
 
     def build_paradigm_info(self, para_id):
@@ -55,20 +58,26 @@ class Dictionary:
 
         tuples representing the paradigm.
         """
-        paradigm = self.paradigms[para_id]
-        paradigm_len = len(paradigm) // 3
-        res = []
-        for idx in range(paradigm_len):
-            prefix_id = paradigm[paradigm_len*2 + idx]
-            prefix = self.paradigm_prefixes[prefix_id]
-
-            suffix_id = paradigm[idx]
-            suffix = self.suffixes[suffix_id]
-
-            res.append(
-                (prefix, self.build_tag_info(para_id, idx), suffix)
+        start = self.paradigms_offsets[para_id]
+        end = self.paradigms_offsets[para_id+1]
+        paradigm_len = (end - start) // 3
+
+        # avoid extra attribute lookups
+        flat = self.paradigms_flat
+        prefixes = self.paradigm_prefixes
+        suffixes = self.suffixes
+        gramtab = self.gramtab
+
+        # paradigm is stored as 3 consecutive columns:
+        # suffix ids, tag ids and prefix ids
+        return [
+            (prefixes[prefix_id], gramtab[tag_id], suffixes[suffix_id])
+            for suffix_id, tag_id, prefix_id in zip(
+                flat[start:start + paradigm_len],
+                flat[start + paradigm_len:start + paradigm_len*2],
+                flat[start + paradigm_len*2:end],
             )
-        return res
+        ]
 
     def build_normal_form(self, para_id: int, idx: int, fixed_word: str) -> str:
         """
@@ -78,13 +87,14 @@ class Dictionary:
         if idx == 0:  # a shortcut: normal form is a word itself
             return fixed_word
 
-        paradigm = self.paradigms[para_id]
-        paradigm_len = len(paradigm) // 3
+        flat = self.paradigms_flat
+        start = self.paradigms_offsets[para_id]
+        paradigm_len = (self.paradigms_offsets[para_id+1] - start) // 3
 
-        stem = self.build_stem(paradigm, idx, fixed_word)
+        stem = self._build_stem(flat, start, paradigm_len, idx, fixed_word)
 
-        normal_prefix_id = paradigm[paradigm_len*2 + 0]
-        normal_suffix_id = paradigm[0]
+        normal_prefix_id = flat[start + paradigm_len*2 + 0]
+        normal_suffix_id = flat[start]
 
         normal_prefix = self.paradigm_prefixes[normal_prefix_id]
         normal_suffix = self.suffixes[normal_suffix_id]
@@ -95,12 +105,22 @@ class Dictionary:
         """
         Return word stem (given a word, paradigm and the word index).
         """
-        paradigm_len = len(paradigm) // 3
+        return self._build_stem(paradigm, 0, len(paradigm) // 3, idx, fixed_word)
 
-        prefix_id = paradigm[paradigm_len*2 + idx]
+    def build_stem_by_id(self, para_id: int, idx: int, fixed_word: str) -> str:
+        """
+        Return word stem (given a word, paradigm id and the word index).
+        """
+        start = self.paradigms_offsets[para_id]
+        paradigm_len = (self.paradigms_offsets[para_id+1] - start) // 3
+        return self._build_stem(self.paradigms_flat, start, paradigm_len, idx, fixed_word)
+
+    def _build_stem(self, data, start, paradigm_len, idx, fixed_word):
+        # paradigm data starts at ``start`` offset in ``data``
+        prefix_id = data[start + paradigm_len*2 + idx]
         prefix = self.paradigm_prefixes[prefix_id]
 
-        suffix_id = paradigm[idx]
+        suffix_id = data[start + idx]
         suffix = self.suffixes[suffix_id]
 
         if suffix:
@@ -2,10 +2,18 @@
 Utils for working with grammatical tags.
 """
 import collections
+import threading
 from sys import intern
 from typing import Union, FrozenSet, Set, Dict
 
 
+try:
+    popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def popcount(value: int) -> int:
+        return bin(value).count('1')
+
+
 # a bit of *heavy* magic...
 class _select_grammeme_from:
     """
@@ -232,6 +240,14 @@ class OpencorporaTag:
     }
     _GRAMMEME_INDICES = collections.defaultdict(int)
     _GRAMMEME_INCOMPATIBLE = collections.defaultdict(set)
+
+    # Bit flags for grammemes, used for fast set operations.
+    # Flags are allocated on first use and never change, so masks
+    # stay valid when the class is initialized with another dictionary.
+    # Bit 0 is reserved for grammemes no tag has.
+    _GRAMMEME_BITS = {}
+    _GRAMMEME_BITS_LOCK = threading.Lock()
+    _UNKNOWN_GRAMMEME_BIT = 1
     _LAT2CYR = None
     _CYR2LAT = None
     KNOWN_GRAMMEMES = set()
@@ -255,7 +271,7 @@ class OpencorporaTag:
     }
 
     __slots__ = ['_grammemes_tuple', '_grammemes_cache', '_str', '_POS',
-                 '_cyr', '_cyr_grammemes_cache']
+                 '_cyr', '_cyr_grammemes_cache', '_hash', '_grammemes_mask']
 
     def __init__(self, tag):
         self._str = tag
@@ -273,6 +289,8 @@ class OpencorporaTag:
         self._assert_grammemes_are_known(set(grammemes_tuple))
 
         self._grammemes_tuple = grammemes_tuple
+        self._hash = hash(grammemes_tuple)
+        self._grammemes_mask = self._grammemes_to_mask(grammemes_tuple, allocate=True)
         self._POS = self._grammemes_tuple[0]
         self._grammemes_cache = None
         self._cyr_grammemes_cache = None
@@ -360,7 +378,8 @@ class OpencorporaTag:
         return self._grammemes_tuple > other._grammemes_tuple
 
     def __hash__(self):
-        return hash(self._grammemes_tuple)
+        # tags are immutable and are hashed a lot (e.g. in "seen" sets)
+        return self._hash
 
     def __len__(self):
         return len(self._grammemes_tuple)
@@ -405,6 +424,26 @@ class OpencorporaTag:
             new_grammemes -= self._GRAMMEME_INCOMPATIBLE[grammeme]
         return new_grammemes
 
+    @classmethod
+    def _grammemes_to_mask(cls, grammemes, allocate=False) -> int:
+        """
+        Return an int with bit flags set for ``grammemes``.
+        Unless ``allocate`` is True, grammemes without a flag
+        are mapped to a flag which is never set for tags.
+        """
+        bits = cls._GRAMMEME_BITS
+        mask = 0
+        for grammeme in grammemes:
+            bit = bits.get(grammeme)
+            if bit is None:
+                if not allocate:
+                    mask |= cls._UNKNOWN_GRAMMEME_BIT
+                    continue
+                with cls._GRAMMEME_BITS_LOCK:
+                    bit = bits.setdefault(grammeme, 2 << len(bits))
+            mask |= bit
+        return mask
+
     @classmethod
     def fix_rare_cases(cls, grammemes: Set[str]) -> FrozenSet[str]:
         """
@@ -41,7 +41,8 @@ class DictionaryAnalyzer(BaseAnalyzerUnit):
         para_data = self.dict.words.similar_item_values(word_lower, self.morph.char_substitutes)
 
         # avoid extra attribute lookups
-        paradigms = self.dict.paradigms
+        flat = self.dict.paradigms_flat
+        offsets = self.dict.paradigms_offsets
         gramtab = self.dict.gramtab
 
         # tag known word
@@ -50,9 +51,9 @@ class DictionaryAnalyzer(BaseAnalyzerUnit):
             for para_id, idx in parse:
                 # result.append(self.build_tag_info(para_id, idx))
                 # .build_tag_info is unrolled for speed
-                paradigm = paradigms[para_id]
-                paradigm_len = len(paradigm) // 3
-                tag_id = paradigm[paradigm_len + idx]
+                start = offsets[para_id]
+                paradigm_len = (offsets[para_id+1] - start) // 3
+                tag_id = flat[start + paradigm_len + idx]
                 result.append(gramtab[tag_id])
 
         return result
@@ -64,11 +65,10 @@ class DictionaryAnalyzer(BaseAnalyzerUnit):
         fixed_word, tag, normal_form, score, methods_stack = form
         _, para_id, idx = self._extract_para_info(methods_stack)
 
-        _para = self.dict.paradigms[para_id]
-        stem = self.dict.build_stem(_para, idx, fixed_word)
+        stem = self.dict.build_stem_by_id(para_id, idx, fixed_word)
 
         result = []
-        paradigm = self.dict.build_paradigm_info(para_id)  # XXX: reuse _para?
+        paradigm = self.dict.build_paradigm_info(para_id)
 
         for index, (_prefix, _tag, _suffix) in enumerate(paradigm):
             word = _prefix + stem + _suffix
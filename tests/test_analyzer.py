@@ -104,6 +104,65 @@ def test_pickling(morph):
     assert morph2.tag('слово') == morph.tag('слово')
 
 
+def test_pickling_cache_size():
+    morph = pymorphy3.MorphAnalyzer(cache_size=0)
+    morph2 = pickle.loads(pickle.dumps(morph, pickle.HIGHEST_PROTOCOL))
+    assert morph2._cache_size == 0
+    assert not hasattr(morph2.parse, 'cache_info')
+
+
+class TestCache:
+    def test_cache_hits(self):
+        morph = pymorphy3.MorphAnalyzer()
+        assert morph.parse('кошка') == morph.parse('кошка')
+        assert morph.parse.cache_info().hits == 1
+        assert morph.tag('кошка') == morph.tag('кошка')
+        assert morph.tag.cache_info().hits == 1
+
+    def test_cached_result_is_a_copy(self, morph):
+        res = morph.parse('кошки')
+        res.clear()
+        assert morph.parse('кошки')
+
+    def test_cache_disabled(self):
+        morph = pymorphy3.MorphAnalyzer(cache_size=0)
+        assert not hasattr(morph.parse, 'cache_info')
+        assert morph.normal_forms('кошке') == ['кошка']
+
+
+def test_probs_for_word(morph):
+    cpd = morph.prob_estimator.p_t_given_w
+    probs = cpd.probs_for_word('стали')
+    assert probs
+    for p in morph.parse('стали'):
+        assert probs.get(str(p.tag), 0) == cpd.prob('стали', p.tag)
+    assert cpd.probs_for_word('сптриояли') == {}
+
+
+def test_unit_groups(morph):
+    assert [u.analyzer for u in morph._units] == [
+        analyzer for group in morph._unit_groups for analyzer in group
+    ]
+    assert isinstance(morph._unit_groups[0][0], DictionaryAnalyzer)
+    assert len(morph._unit_groups[0]) == 3
+
+
+@pytest.mark.parametrize('word', ['стали', 'кошка', 'бутявкой', 'Maßstab', 'мегакоту'])
+@pytest.mark.parametrize('k', [0, 1, 2, 10])
+def test_parse_top(word, k, morph):
+    assert morph.parse_top(word, k) == morph.parse(word)[:k]
+
+
+def test_parse_top_plain_tuples():
+    morph_plain = pymorphy3.MorphAnalyzer(result_type=None)
+    assert morph_plain.parse_top('стали') == morph_plain.parse('стали')[:1]
+
+
+def test_parse_top_negative_k(morph):
+    with pytest.raises(ValueError):
+        morph.parse_top('стали', -1)
+
+
 def with_test_data(data, second_param_name='parse_result'):
     return pytest.mark.parametrize(
         ("word", second_param_name),
@@ -228,6 +287,10 @@ class TestUtils:
         assert morph.word_is_known('ёж')
         assert not morph.word_is_known('еш')
 
+    def test_word_is_known_without_substitutes(self, morph):
+        assert morph.word_is_known('Кошка')
+        assert not morph.word_is_known('кошкп')
+
     def test_word_is_known_strict(self, morph):
         assert not morph.word_is_known('еж', strict=True)
         assert morph.word_is_known('ёж', strict=True)
@@ -1,7 +1,20 @@
+import array
+import os
+import shutil
+import struct
+
 import pytest
 
 import pymorphy3
 from pymorphy3.analyzer import lang_dict_path
+from pymorphy3.opencorpora_dict.storage import (
+    load_dict,
+    _load_paradigms,
+    _load_paradigms_flat,
+    _parse_paradigms,
+    _ParadigmList,
+    _save_paradigms_flat,
+)
 
 
 def test_old_dictionaries_supported():
@@ -50,3 +63,111 @@ def test_nonmatching_language():
     m = pymorphy3.MorphAnalyzer(path=ru_path, lang='uk')
     assert 'Init' in m.parse('Ї')[0].tag
     assert m.lang == 'uk'
+
+
+def test_dictionary_is_shared(morph):
+    m = pymorphy3.MorphAnalyzer()
+    assert m.dictionary is morph.dictionary
+    assert m.prob_estimator is morph.prob_estimator
+    assert m.char_substitutes is morph.char_substitutes
+
+
+def test_shared_dictionary_custom_substitutes(morph):
+    m = pymorphy3.MorphAnalyzer(char_substitutes={})
+    assert m.dictionary is morph.dictionary
+    assert not m.char_substitutes
+    assert morph.char_substitutes
+
+
+def test_tag_class_reinitialized_for_shared_dictionary(morph):
+    pytest.importorskip("pymorphy3_dicts_uk")
+    known_grammemes = set(morph.TagClass.KNOWN_GRAMMEMES)
+    pymorphy3.MorphAnalyzer(lang='uk')
+    m = pymorphy3.MorphAnalyzer()
+    assert m.dictionary is morph.dictionary
+    assert m.lat2cyr('NOUN') == 'СУЩ'
+    assert m.parse('стали')[0].tag.cyr_repr == 'ГЛ,сов,неперех мн,прош,изъяв'
+    assert m.TagClass.KNOWN_GRAMMEMES == known_grammemes
+
+
+def test_recompiled_dictionary_is_reloaded(tmpdir):
+    path = str(tmpdir.join('dict'))
+    shutil.copytree(lang_dict_path('ru'), path)
+    m1 = pymorphy3.MorphAnalyzer(path)
+    assert pymorphy3.MorphAnalyzer(path).dictionary is m1.dictionary
+
+    meta_filename = os.path.join(path, 'meta.json')
+    mtime = os.stat(meta_filename).st_mtime_ns
+    os.utime(meta_filename, ns=(mtime + 10**9, mtime + 10**9))
+    assert pymorphy3.MorphAnalyzer(path).dictionary is not m1.dictionary
+
+
+def test_parse_paradigms():
+    para1 = array.array("H", [1, 2, 3])
+    para2 = array.array("H", [4])
+    # headers are always little-endian, paradigm data is native
+    buffer = b"".join([
+        struct.pack("<H", 2),
+        struct.pack("<H", 3), para1.tobytes(),
+        struct.pack("<H", 1), para2.tobytes(),
+    ])
+    flat, offsets = _parse_paradigms(buffer)
+    assert flat == array.array("H", [1, 2, 3, 4])
+    assert offsets == array.array("I", [0, 3, 4])
+
+    paradigms = _ParadigmList(flat, offsets)
+    assert len(paradigms) == 2
+    assert list(paradigms) == [para1, para2]
+    assert paradigms[-1] == para2
+    assert paradigms[:1] == [para1]
+    with pytest.raises(IndexError):
+        paradigms[2]
+
+
+def test_prediction_dawgs_are_loaded_lazily():
+    d = load_dict(lang_dict_path('ru'))
+    dawgs = d.prediction_suffixes_dawgs
+    assert all(item is None for item in dawgs._dawgs)
+    assert dawgs[0] is dawgs[0]
+    assert dawgs._dawgs[0] is not None
+    assert dawgs._dawgs[1] is None
+    assert dawgs[0:2] == [dawgs[0], dawgs[1]]
+    assert all(item is not None for item in dawgs[0:2])
+
+
+def test_paradigms_flat_roundtrip(tmpdir):
+    flat, offsets = _load_paradigms(os.path.join(lang_dict_path('ru'), 'paradigms.array'))
+    paradigms = _ParadigmList(flat, offsets)
+    flat_filename = str(tmpdir.join('paradigms-flat.array'))
+    offsets_filename = str(tmpdir.join('paradigms-offsets.array'))
+
+    _save_paradigms_flat(paradigms, flat_filename, offsets_filename)
+    assert _load_paradigms_flat(flat_filename, offsets_filename) == (flat, offsets)
+    # offsets are stored as 32-bit numbers
+    assert os.path.getsize(offsets_filename) == 4 * (len(paradigms) + 1)
+
+
+def test_flat_paradigms_dictionary(tmpdir, morph):
+    path = str(tmpdir.join('dict'))
+    shutil.copytree(lang_dict_path('ru'), path)
+    flat, offsets = _load_paradigms(os.path.join(path, 'paradigms.array'))
+    os.remove(os.path.join(path, 'paradigms.array'))
+    _save_paradigms_flat(
+        _ParadigmList(flat, offsets),
+        os.path.join(path, 'paradigms-flat.array'),
+        os.path.join(path, 'paradigms-offsets.array'),
+    )
+
+    m = pymorphy3.MorphAnalyzer(path)
+    assert m.dictionary.paradigms_flat == flat
+    for word in ['стали', 'людей', 'кошки']:
+        assert [p[:4] for p in m.parse(word)] == [p[:4] for p in morph.parse(word)]
+        lexeme = [p[:4] for p in m.parse(word)[0].lexeme]
+        assert lexeme == [p[:4] for p in morph.parse(word)[0].lexeme]
+
+
+def test_build_stem_by_id(morph):
+    d = morph.dictionary
+    for para_id, idx in d.words['стали']:
+        paradigm = d.paradigms[para_id]
+        assert d.build_stem_by_id(para_id, idx, 'стали') == d.build_stem(paradigm, idx, 'стали')
@@ -1,3 +1,6 @@
+import pymorphy3.analyzer
+
+
 def test_indexing(morph):
     assert len(morph.parse('стреляли')) == 1
     p = morph.parse('стреляли')[0]
@@ -28,3 +31,43 @@ def test_is_known(morph):
 
 def test_normalized(morph):
     assert morph.parse('стреляли')[0].normalized.word == 'стрелять'
+
+
+def test_no_instance_dict(morph):
+    p = morph.parse('стреляли')[0]
+    assert not hasattr(p, '__dict__')
+    assert p == tuple(p)
+
+
+def test_shared_result_class(morph):
+    p = morph.parse('стреляли')[0]
+    assert type(p) is pymorphy3.analyzer.Parse
+    assert p._morph is morph
+
+
+class PlainResult:
+    def __init__(self, word, tag, normal_form, score, methods_stack):
+        self.word = word
+        self.normal_form = normal_form
+
+
+def test_non_tuple_result_type():
+    morph = pymorphy3.MorphAnalyzer(result_type=PlainResult)
+    p = morph.parse('стреляли')[0]
+    assert isinstance(p, PlainResult)
+    assert p.word == 'стреляли'
+    assert p.normal_form == 'стрелять'
+
+
+class UppercaseParse(pymorphy3.analyzer.Parse):
+    __slots__ = ()
+
+    def __new__(cls, word, tag, normal_form, score, methods_stack):
+        return super().__new__(cls, word.upper(), tag, normal_form, score, methods_stack)
+
+
+def test_result_type_with_custom_new():
+    morph = pymorphy3.MorphAnalyzer(result_type=UppercaseParse)
+    p = morph.parse('кошка')[0]
+    assert type(p) is UppercaseParse
+    assert p.word == 'КОШКА'
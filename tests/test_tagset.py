@@ -17,6 +17,17 @@ def test_hashing(Tag):
     assert {tag3} != {tag1}
 
 
+def test_grammemes_mask(Tag):
+    tag = Tag('NOUN,anim,masc sing,nomn')
+    to_mask = Tag._grammemes_to_mask
+
+    assert tag._grammemes_mask == to_mask(tag.grammemes)
+    assert not to_mask({'NOUN', 'sing'}) & ~tag._grammemes_mask
+    assert to_mask({'NOUN', 'plur'}) & ~tag._grammemes_mask
+    assert to_mask({'NOUN', 'foo'}) & ~tag._grammemes_mask
+    assert 'foo' not in Tag._GRAMMEME_BITS
+
+
 @pytest.mark.parametrize(("tag", "cls"), [
         ['NOUN', 'NOUN'],
         ['NOUN,sing', 'NOUN'],
@@ -39,3 +39,11 @@ def test_threading_multiple_morph_analyzers():
 def test_threading_create_analyzer():
     with concurrent.futures.ThreadPoolExecutor(3) as executor:
         list(executor.map(_create_morph_analyzer, range(10)))
+
+
+def test_threading_create_analyzer_registers_grammemes():
+    with concurrent.futures.ThreadPoolExecutor(3) as executor:
+        analyzers = list(executor.map(lambda i: pymorphy3.MorphAnalyzer(), range(10)))
+    Tag = analyzers[-1].TagClass
+    assert {'UNKN', 'LATN', 'Init', 'Name', 'Patr'} <= Tag.KNOWN_GRAMMEMES
+    assert Tag.lat2cyr('UNKN') == 'НЕИЗВ'